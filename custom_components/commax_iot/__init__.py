@@ -1,11 +1,13 @@
 """Commax IoT 통합 구성요소"""
 import logging
 from datetime import timedelta
+from typing import Sequence
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .auth import CommaxAuthManager
@@ -19,6 +21,7 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     PLATFORMS,
+    REQUEST_REFRESH_COOLDOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -79,9 +82,18 @@ class CommaxDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            # 여러 엔터티의 명령 직후 새로고침 요청을 한 번의 API 조회로 합침
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.auth_manager = auth_manager
         self._devices = {}
+        self._subdevices = {}
+        self._devices_by_type = {}
 
     async def _async_update_data(self):
         """데이터 업데이트"""
@@ -92,12 +104,21 @@ class CommaxDataUpdateCoordinator(DataUpdateCoordinator):
                 return self._devices or {}
 
             device_data = {}
+            subdevices = {}
+            devices_by_type = {}
             for device in devices:
                 root_uuid = device.get("rootUuid")
                 if root_uuid:
                     device_data[root_uuid] = device
+                    subdevices[root_uuid] = {
+                        subdevice.get("subUuid"): subdevice
+                        for subdevice in device.get("subDevice") or ()
+                    }
+                    devices_by_type.setdefault(device.get("commaxDevice"), []).append(device)
 
             self._devices = device_data
+            self._subdevices = subdevices
+            self._devices_by_type = devices_by_type
             return device_data
 
         except Exception as err:
@@ -107,4 +128,13 @@ class CommaxDataUpdateCoordinator(DataUpdateCoordinator):
 
     def get_device_by_uuid(self, root_uuid: str):
         """UUID로 디바이스 조회"""
-        return self._devices.get(root_uuid)
\ No newline at end of file
+        return self._devices.get(root_uuid)
+
+    def get_devices_by_type(self, commax_device: str) -> Sequence[dict]:
+        """디바이스 종류(commaxDevice)별 디바이스 목록 조회"""
+        return self._devices_by_type.get(commax_device) or ()
+
+    def get_subdevice(self, root_uuid: str, sub_uuid: str):
+        """루트 UUID와 서브 UUID로 서브디바이스 조회"""
+        subdevices = self._subdevices.get(root_uuid)
+        return subdevices.get(sub_uuid) if subdevices else None
\ No newline at end of file
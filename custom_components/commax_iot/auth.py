@@ -10,17 +10,52 @@ import aiohttp
 from .const import (
     API_SUCCESS_CODE,
     AUTH_URL,
+    COMMAND_TIMEOUT,
     COMMAND_URL,
     DEFAULT_CLIENT_ID,
     DEFAULT_GRANT_TYPE,
     DEFAULT_OS_CODE,
     DEFAULT_TOKEN_EXPIRE,
     DEVICE_LIST_URL,
+    DEVICE_OFF,
+    DEVICE_ON,
+    SUBDEVICE_SWITCH_BINARY,
     TOKEN_EXPIRE_BUFFER,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_COMMAND_TIMEOUT = aiohttp.ClientTimeout(total=COMMAND_TIMEOUT)
+
+
+def build_command_base(subdevice: Optional[Dict], sort: str) -> Optional[Dict]:
+    """서브디바이스 제어 명령 중 값을 제외한 고정 필드 생성 (서브디바이스가 없으면 None)"""
+    if not subdevice:
+        return None
+
+    return {
+        "funcCommand": "set",
+        "type": "readWrite",
+        "subUuid": subdevice.get("subUuid"),
+        "sort": sort,
+    }
+
+
+def build_switch_payloads(
+    root_uuid: str, nickname: str, root_device: Optional[str], switch_subdevice: Dict
+) -> Dict[str, Dict]:
+    """스위치 서브디바이스의 on/off 명령 페이로드를 값별로 완성 (전송 시 수정하지 않음)"""
+    switch_command = build_command_base(switch_subdevice, SUBDEVICE_SWITCH_BINARY)
+    return {
+        value: {
+            "rootUuid": root_uuid,
+            "nickname": nickname,
+            "rootDevice": root_device,
+            "subDevice": [{**switch_command, "value": value}],
+        }
+        for value in (DEVICE_ON, DEVICE_OFF)
+    }
+
 
 class CommaxAuthManager:
     """Commax IoT API 인증 관리자"""
@@ -154,7 +189,7 @@ class CommaxAuthManager:
 
     async def send_device_command(self, device_data: Dict) -> bool:
         """디바이스 제어 명령 전송"""
-        _LOGGER.warning("API 명령 전송 시작 - device: %s", device_data.get('nickname', 'Unknown'))
+        _LOGGER.debug("API 명령 전송 시작 - device: %s", device_data.get("nickname", "Unknown"))
 
         token = await self.get_access_token()
         if not token:
@@ -181,7 +216,7 @@ class CommaxAuthManager:
             }
 
             async with self._session.post(
-                COMMAND_URL, json=command_data, headers=headers
+                COMMAND_URL, json=command_data, headers=headers, timeout=_COMMAND_TIMEOUT
             ) as response:
                 _LOGGER.debug(
                     "Commax IoT 디바이스 제어 HTTP 상태: %s",
@@ -196,7 +231,10 @@ class CommaxAuthManager:
                         return False
                     headers["Authorization"] = f"Bearer {token}"
                     async with self._session.post(
-                        COMMAND_URL, json=command_data, headers=headers
+                        COMMAND_URL,
+                        json=command_data,
+                        headers=headers,
+                        timeout=_COMMAND_TIMEOUT,
                     ) as retry_response:
                         if retry_response.status != 200:
                             return False
@@ -206,11 +244,15 @@ class CommaxAuthManager:
                 else:
                     result = await response.json()
 
-            success = result and result.get("resultCode") == API_SUCCESS_CODE
-            _LOGGER.warning("API 응답 결과 - success: %s, resultCode: %s, resultMessage: %s",
-                          success,
-                          result.get("resultCode") if result else "No result",
-                          result.get("resultMessage", "No message") if result else "No result")
+            success = bool(result) and result.get("resultCode") == API_SUCCESS_CODE
+            # 실패 응답만 경고로 남기고 정상 응답은 디버그 레벨에서만 기록
+            _LOGGER.log(
+                logging.DEBUG if success else logging.WARNING,
+                "API 응답 결과 - success: %s, resultCode: %s, resultMessage: %s",
+                success,
+                result.get("resultCode") if result else "No result",
+                result.get("resultMessage", "No message") if result else "No result",
+            )
             return success
 
         except Exception as e:
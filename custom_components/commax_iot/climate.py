@@ -1,5 +1,4 @@
 """Commax IoT 보일러 플랫폼"""
-import asyncio
 import logging
 from copy import deepcopy
 from typing import Any, Optional
@@ -16,6 +15,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .auth import build_command_base
 from .const import (
     DEVICE_OFF,
     DEVICE_TYPE_BOILER,
@@ -39,20 +39,17 @@ async def async_setup_entry(
 
     entities = []
 
-    await coordinator.async_refresh()
-
-    for device_uuid, device_data in coordinator.data.items():
-        if device_data.get("commaxDevice") == DEVICE_TYPE_BOILER:
-            entities.append(CommaxThermostat(coordinator, auth_manager, device_data))
-            _LOGGER.debug(
-                "보일러 디바이스 등록: %s (UUID: %s)",
-                device_data.get("nickname"),
-                device_data.get("rootUuid"),
-            )
+    for device_data in coordinator.get_devices_by_type(DEVICE_TYPE_BOILER):
+        entities.append(CommaxThermostat(coordinator, auth_manager, device_data))
+        _LOGGER.debug(
+            "보일러 디바이스 등록: %s (UUID: %s)",
+            device_data.get("nickname"),
+            device_data.get("rootUuid"),
+        )
 
     if entities:
         _LOGGER.info("총 %d개의 보일러 디바이스 등록됨", len(entities))
-        async_add_entities(entities, True)
+        async_add_entities(entities)
     else:
         _LOGGER.debug("등록할 보일러 디바이스가 없습니다")
 
@@ -64,7 +61,6 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
         """보일러 엔터티 초기화"""
         super().__init__(coordinator)
         self._auth_manager = auth_manager
-        self._device_data = device_data
         self._root_uuid = device_data.get("rootUuid")
         self._nickname = device_data.get("nickname", "Commax Thermostat")
 
@@ -72,7 +68,7 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
         self._mode_subdevice = None
         self._setpoint_subdevice = None
 
-        for subdevice in device_data.get("subDevice", []):
+        for subdevice in device_data.get("subDevice") or ():
             sort_type = subdevice.get("sort")
             if sort_type == SUBDEVICE_AIR_TEMPERATURE:
                 self._temp_subdevice = subdevice
@@ -81,6 +77,19 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
             elif sort_type == SUBDEVICE_THERMOSTAT_SETPOINT and subdevice.get("type") == "readWrite":
                 self._setpoint_subdevice = subdevice
 
+        # 상태 조회 시 매번 dict 조회하지 않도록 서브디바이스 UUID를 미리 저장
+        self._temp_sub_uuid = (self._temp_subdevice or {}).get("subUuid")
+        self._mode_sub_uuid = (self._mode_subdevice or {}).get("subUuid")
+        self._setpoint_sub_uuid = (self._setpoint_subdevice or {}).get("subUuid")
+
+        # 모드/설정온도 명령의 서브디바이스 고정 필드는 미리 만들어 둠
+        self._mode_command = build_command_base(
+            self._mode_subdevice, SUBDEVICE_THERMOSTAT_MODE
+        )
+        self._setpoint_command = build_command_base(
+            self._setpoint_subdevice, SUBDEVICE_THERMOSTAT_SETPOINT
+        )
+
         self._attr_unique_id = f"{DOMAIN}_{self._root_uuid}_climate"
         self._attr_name = self._nickname
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -104,18 +113,14 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
         if not self._temp_subdevice:
             return None
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, self._temp_sub_uuid)
+        if subdevice is None:
             return None
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == self._temp_subdevice.get("subUuid"):
-                try:
-                    return float(subdevice.get("value", 0))
-                except (ValueError, TypeError):
-                    return None
-
-        return None
+        try:
+            return float(subdevice.get("value", 0))
+        except (ValueError, TypeError):
+            return None
 
     @property
     def target_temperature(self) -> Optional[float]:
@@ -123,40 +128,31 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
         if not self._setpoint_subdevice:
             return None
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, self._setpoint_sub_uuid)
+        if subdevice is None:
             return None
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == self._setpoint_subdevice.get("subUuid"):
-                try:
-                    return float(subdevice.get("value", 20))
-                except (ValueError, TypeError):
-                    return None
-
-        return None
+        try:
+            return float(subdevice.get("value", 20))
+        except (ValueError, TypeError):
+            return None
 
     @property
     def hvac_mode(self) -> HVACMode:
         """현재 HVAC 모드 반환"""
         if not self._mode_subdevice:
-            _LOGGER.warning("보일러 %s: mode_subdevice가 없어 OFF 모드 반환", self._nickname)
+            _LOGGER.debug("보일러 %s: mode_subdevice가 없어 OFF 모드 반환", self._nickname)
             return HVACMode.OFF
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
-            _LOGGER.warning("보일러 %s: 디바이스 데이터가 없어 OFF 모드 반환", self._nickname)
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, self._mode_sub_uuid)
+        if subdevice is None:
+            _LOGGER.debug("보일러 %s: 모드 서브디바이스를 찾을 수 없어 OFF 모드 반환", self._nickname)
             return HVACMode.OFF
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == self._mode_subdevice.get("subUuid"):
-                current_value = str(subdevice.get("value", "")).lower()
-                mode = HVACMode.HEAT if current_value == "heat" else HVACMode.OFF
-                _LOGGER.warning("보일러 %s: 현재 모드 값 '%s' -> %s", self._nickname, current_value, mode)
-                return mode
-
-        _LOGGER.warning("보일러 %s: 모드 서브디바이스를 찾을 수 없어 OFF 모드 반환", self._nickname)
-        return HVACMode.OFF
+        current_value = str(subdevice.get("value", "")).lower()
+        mode = HVACMode.HEAT if current_value == "heat" else HVACMode.OFF
+        _LOGGER.debug("보일러 %s: 현재 모드 값 '%s' -> %s", self._nickname, current_value, mode)
+        return mode
 
     @property
     def available(self) -> bool:
@@ -169,8 +165,20 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """목표 온도 설정"""
+        # 모드와 온도 명령을 함께 보내도 상태 새로고침은 한 번만 예약
+        if await self._async_apply_temperature(**kwargs):
+            await self.coordinator.async_request_refresh()
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """HVAC 모드 설정"""
+        if await self._async_apply_hvac_mode(hvac_mode):
+            await self.coordinator.async_request_refresh()
+
+    async def _async_apply_temperature(self, **kwargs: Any) -> bool:
+        """목표 온도 명령 전송 (명령을 보냈으면 True)"""
         hvac_mode_raw = kwargs.get("hvac_mode")
         normalized_mode = None
+        command_sent = False
 
         if hvac_mode_raw is not None:
             normalized_mode = self._normalize_hvac_mode(hvac_mode_raw)
@@ -181,17 +189,17 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
                     hvac_mode_raw,
                 )
             else:
-                await self.async_set_hvac_mode(normalized_mode)
+                command_sent = await self._async_apply_hvac_mode(normalized_mode)
                 if normalized_mode == HVACMode.OFF:
                     _LOGGER.debug(
                         "보일러 %s: HVAC OFF 요청과 함께 받은 온도 명령을 무시합니다",
                         self._nickname,
                     )
-                    return
+                    return command_sent
 
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None or not self._setpoint_subdevice:
-            return
+            return command_sent
 
         effective_mode = normalized_mode or self.hvac_mode
         if effective_mode == HVACMode.OFF:
@@ -199,7 +207,7 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
                 "보일러 %s: 현재 HVAC 모드가 OFF라 온도 명령을 생략합니다",
                 self._nickname,
             )
-            return
+            return command_sent
 
         _LOGGER.debug(
             "보일러 온도 설정 요청: %s -> %s°C (HVAC 모드: %s)",
@@ -208,9 +216,10 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
             effective_mode,
         )
         await self._send_temperature_command(str(temperature))
+        return True
 
-    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        """HVAC 모드 설정"""
+    async def _async_apply_hvac_mode(self, hvac_mode: Any) -> bool:
+        """HVAC 모드 명령 전송 (명령을 보냈으면 True)"""
         normalized_mode = self._normalize_hvac_mode(hvac_mode)
         if normalized_mode is None:
             _LOGGER.warning(
@@ -218,11 +227,11 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
                 self._nickname,
                 hvac_mode,
             )
-            return
+            return False
 
         if not self._mode_subdevice:
             _LOGGER.warning("보일러 %s: mode_subdevice가 없어 HVAC 모드 설정 불가", self._nickname)
-            return
+            return False
 
         if normalized_mode not in (HVACMode.HEAT, HVACMode.OFF):
             _LOGGER.warning(
@@ -230,10 +239,10 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
                 self._nickname,
                 normalized_mode,
             )
-            return
+            return False
 
         value = "heat" if normalized_mode == HVACMode.HEAT else DEVICE_OFF
-        _LOGGER.warning(
+        _LOGGER.debug(
             "보일러 %s: HVAC 모드 설정 요청 %s -> %s (값: %s)",
             self._nickname,
             normalized_mode,
@@ -241,110 +250,77 @@ class CommaxThermostat(CoordinatorEntity, ClimateEntity):
             value,
         )
         await self._send_mode_command(value)
+        return True
 
     async def _send_temperature_command(self, temperature: str) -> None:
         """온도 설정 명령 전송"""
-        device_data = self._prepare_device_command(
-            self._setpoint_subdevice, SUBDEVICE_THERMOSTAT_SETPOINT, temperature
-        )
+        device_data = self._prepare_device_command(self._setpoint_command, temperature)
         if device_data is None:
             return
 
         success = await self._auth_manager.send_device_command(device_data)
 
         if success:
-            self._update_local_subdevice_value(
-                self._setpoint_subdevice.get("subUuid"), temperature
-            )
+            self._update_local_subdevice_value(self._setpoint_sub_uuid, temperature)
             self.async_write_ha_state()
 
-        asyncio.create_task(self._delayed_refresh())
-
     async def _send_mode_command(self, mode_value: str) -> None:
         """모드 설정 명령 전송"""
-        _LOGGER.warning("보일러 %s: 모드 명령 전송 시작 - 값: %s", self._nickname, mode_value)
+        _LOGGER.debug("보일러 %s: 모드 명령 전송 시작 - 값: %s", self._nickname, mode_value)
 
-        device_data = self._prepare_device_command(
-            self._mode_subdevice, SUBDEVICE_THERMOSTAT_MODE, mode_value
-        )
+        device_data = self._prepare_device_command(self._mode_command, mode_value)
         if device_data is None:
             _LOGGER.warning("보일러 %s: device_data 준비 실패", self._nickname)
             return
 
-        _LOGGER.warning("보일러 %s: API 명령 전송 시작 - device_data: %s", self._nickname, device_data)
+        _LOGGER.debug("보일러 %s: API 명령 전송 시작 - device_data: %s", self._nickname, device_data)
         success = await self._auth_manager.send_device_command(device_data)
-        _LOGGER.warning("보일러 %s: API 명령 결과 - success: %s", self._nickname, success)
+        _LOGGER.debug("보일러 %s: API 명령 결과 - success: %s", self._nickname, success)
 
         if success:
-            _LOGGER.warning("보일러 %s: 명령 성공 - 로컬 상태 업데이트 %s = %s", self._nickname, self._mode_subdevice.get("subUuid"), mode_value)
-            self._update_local_subdevice_value(
-                self._mode_subdevice.get("subUuid"), mode_value
-            )
+            _LOGGER.debug("보일러 %s: 명령 성공 - 로컬 상태 업데이트 %s = %s", self._nickname, self._mode_sub_uuid, mode_value)
+            self._update_local_subdevice_value(self._mode_sub_uuid, mode_value)
             self.async_write_ha_state()
         else:
             _LOGGER.warning("보일러 %s: API 명령 실패 - 로컬 상태 업데이트 안함", self._nickname)
 
-        asyncio.create_task(self._delayed_refresh())
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """코디네이터 업데이트 처리"""
         self.async_write_ha_state()
 
-    def _prepare_device_command(self, subdevice: dict, sort: str, value: str) -> Optional[dict]:
+    def _prepare_device_command(self, command_base: Optional[dict], value: str) -> Optional[dict]:
         """디바이스 명령 데이터 준비 - 올바른 API 구조 사용"""
-        if not subdevice:
+        if not command_base:
             return None
 
+        # 코디네이터에서 사라진 디바이스에는 명령을 보내지 않고, 이름 등은 최신 데이터 사용
         current_device = self.coordinator.get_device_by_uuid(self._root_uuid)
         if not current_device:
             return None
 
         # API 구조에 맞게 변경할 서브디바이스만 포함
-        device_payload = {
-            "subDevice": [
-                {
-                    "value": value,
-                    "funcCommand": "set",
-                    "type": "readWrite",
-                    "subUuid": subdevice.get("subUuid"),
-                    "sort": sort
-                }
-            ],
+        return {
+            "subDevice": [{**command_base, "value": value}],
             "rootUuid": current_device.get("rootUuid"),
             "nickname": current_device.get("nickname"),
-            "rootDevice": current_device.get("rootDevice")
+            "rootDevice": current_device.get("rootDevice"),
         }
 
-        return device_payload
-
-    async def _delayed_refresh(self) -> None:
-        """1초 후 상태 새로고침"""
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
-
     def _update_local_subdevice_value(self, sub_uuid: str, value: str) -> None:
         """로컬 서브디바이스 값을 즉시 업데이트"""
         if not sub_uuid:
             _LOGGER.warning("보일러 %s: sub_uuid가 누락되어 로컬 업데이트 불가", self._nickname)
             return
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
-            _LOGGER.warning("보일러 %s: 코디네이터에서 디바이스 데이터를 찾을 수 없음", self._nickname)
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, sub_uuid)
+        if subdevice is None:
+            _LOGGER.warning("보일러 %s: 대상 서브디바이스 찾을 수 없음 - UUID: %s", self._nickname, sub_uuid)
             return
 
-        updated = False
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == sub_uuid:
-                old_value = subdevice.get("value")
-                subdevice["value"] = value
-                updated = True
-                _LOGGER.warning("보일러 %s: 로컬 업데이트 완료 %s: %s -> %s", self._nickname, sub_uuid, old_value, value)
-                break
-
-        if not updated:
-            _LOGGER.warning("보일러 %s: 대상 서브디바이스 찾을 수 없음 - UUID: %s", self._nickname, sub_uuid)
+        old_value = subdevice.get("value")
+        subdevice["value"] = value
+        _LOGGER.debug("보일러 %s: 로컬 업데이트 완료 %s: %s -> %s", self._nickname, sub_uuid, old_value, value)
 
     def _normalize_hvac_mode(self, hvac_mode: Any) -> Optional[HVACMode]:
         """HVAC 모드 입력을 표준 Enum으로 변환"""
@@ -20,6 +20,8 @@ CONF_UPDATE_INTERVAL = "update_interval"
 
 # 기본값
 DEFAULT_UPDATE_INTERVAL = 30
+REQUEST_REFRESH_COOLDOWN = 1.0  # 제어 명령 후 새로고침 요청을 모아 한 번만 조회 (초)
+COMMAND_TIMEOUT = 10  # 제어 명령 요청 1회의 최대 대기 시간 (초)
 DEFAULT_CLIENT_ID = "APP-IOS-com.commax.iphomeiot"
 DEFAULT_OS_CODE = "IOS"
 DEFAULT_GRANT_TYPE = "password"
@@ -46,6 +48,9 @@ DEVICE_ON = "on"
 DEVICE_VALUE_OFF = "off"
 DEVICE_VALUE_ON = "on"
 
+# 켜짐으로 판단하는 값 (소문자로 정규화한 뒤 비교)
+DEVICE_ON_VALUES = frozenset({DEVICE_ON, DEVICE_VALUE_ON, "1", "true"})
+
 # 환기시스템 모드
 FAN_MODE_BYPASS = "bypass"
 FAN_MODE_MANUAL = "manual"
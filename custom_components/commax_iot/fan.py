@@ -1,5 +1,4 @@
 """Commax IoT 환기시스템 플랫폼"""
-import asyncio
 import math
 import logging
 from typing import Any, Optional
@@ -11,9 +10,11 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .auth import build_command_base
 from .const import (
     DEVICE_OFF,
     DEVICE_ON,
+    DEVICE_ON_VALUES,
     DEVICE_TYPE_FAN,
     DOMAIN,
     FAN_DEFAULT_MODE,
@@ -36,36 +37,33 @@ async def async_setup_entry(
 
     entities = []
 
-    await coordinator.async_refresh()
+    for device_data in coordinator.get_devices_by_type(DEVICE_TYPE_FAN):
+        if device_data.get("rootDevice") != "switch":
+            continue
 
-    for device_uuid, device_data in coordinator.data.items():
-        if (
-            device_data.get("commaxDevice") == DEVICE_TYPE_FAN
-            and device_data.get("rootDevice") == "switch"
-        ):
-            has_switch = any(
-                sub.get("sort") == SUBDEVICE_SWITCH_BINARY and sub.get("type") == "readWrite"
-                for sub in device_data.get("subDevice", [])
-            )
-
-            if not has_switch:
-                _LOGGER.debug(
-                    "환기시스템 전원 서브디바이스가 없어 스킵: %s (UUID: %s)",
-                    device_data.get("nickname"),
-                    device_data.get("rootUuid"),
-                )
-                continue
+        has_switch = any(
+            sub.get("sort") == SUBDEVICE_SWITCH_BINARY and sub.get("type") == "readWrite"
+            for sub in device_data.get("subDevice") or ()
+        )
 
-            entities.append(CommaxFan(coordinator, auth_manager, device_data))
+        if not has_switch:
             _LOGGER.debug(
-                "환기시스템 디바이스 등록: %s (UUID: %s)",
+                "환기시스템 전원 서브디바이스가 없어 스킵: %s (UUID: %s)",
                 device_data.get("nickname"),
                 device_data.get("rootUuid"),
             )
+            continue
+
+        entities.append(CommaxFan(coordinator, auth_manager, device_data))
+        _LOGGER.debug(
+            "환기시스템 디바이스 등록: %s (UUID: %s)",
+            device_data.get("nickname"),
+            device_data.get("rootUuid"),
+        )
 
     if entities:
         _LOGGER.info("총 %d개의 환기시스템 디바이스 등록됨", len(entities))
-        async_add_entities(entities, True)
+        async_add_entities(entities)
     else:
         _LOGGER.debug("등록할 환기시스템 디바이스가 없습니다")
 
@@ -77,35 +75,55 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         """환기시스템 엔터티 초기화"""
         super().__init__(coordinator)
         self._auth_manager = auth_manager
-        self._device_data = device_data
         self._root_uuid = device_data.get("rootUuid")
         self._nickname = device_data.get("nickname", "Commax Fan")
 
-        self._switch_subdevice = None
-        self._mode_subdevice = None
-        self._speed_subdevice = None
+        self._switch_subdevice: Optional[dict] = None
+        self._mode_subdevice: Optional[dict] = None
+        self._speed_subdevice: Optional[dict] = None
         self._speed_options: list[str] = []
-        for subdevice in device_data.get("subDevice", []):
-            if (
-                subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY
-                and subdevice.get("type") == "readWrite"
-            ):
+
+        # subDevice를 한 번만 훑으며 종류별로 분류 (같은 sort가 여러 개면 기존처럼 마지막 항목 사용)
+        for subdevice in device_data.get("subDevice") or ():
+            if subdevice.get("type") != "readWrite":
+                continue
+            sort = subdevice.get("sort")
+            if sort == SUBDEVICE_SWITCH_BINARY:
                 self._switch_subdevice = subdevice
-            elif (
-                subdevice.get("sort") == SUBDEVICE_FAN_MODE
-                and subdevice.get("type") == "readWrite"
-            ):
+            elif sort == SUBDEVICE_FAN_MODE:
                 self._mode_subdevice = subdevice
-            elif (
-                subdevice.get("sort") == SUBDEVICE_FAN_SPEED
-                and subdevice.get("type") == "readWrite"
-            ):
+            elif sort == SUBDEVICE_FAN_SPEED:
                 self._speed_subdevice = subdevice
                 options = subdevice.get("subOption")
                 if isinstance(options, list) and options:
                     self._speed_options = [str(option) for option in options if option]
                 elif subdevice.get("value"):
                     self._speed_options = [str(subdevice.get("value"))]
+        self._has_subdevice = self._switch_subdevice is not None
+
+        # 속도 값 -> 백분율 매핑을 미리 계산해 조회 시 한 번의 dict 조회로 처리
+        speed_step = 100 / len(self._speed_options) if self._speed_options else 0
+        self._speed_percentages: dict[str, int] = {}
+        for index, speed in enumerate(self._speed_options):
+            self._speed_percentages.setdefault(
+                speed, max(1, min(100, round((index + 1) * speed_step)))
+            )
+
+        # 전원/모드/속도 명령의 고정 필드 (해당 서브디바이스가 있을 때만 호출부에서 사용)
+        self._command_template = {
+            "rootUuid": self._root_uuid,
+            "nickname": self._nickname,
+            "rootDevice": device_data.get("rootDevice"),
+        }
+        self._switch_command = build_command_base(
+            self._switch_subdevice, SUBDEVICE_SWITCH_BINARY
+        )
+        self._mode_command = build_command_base(
+            self._mode_subdevice, SUBDEVICE_FAN_MODE
+        )
+        self._speed_command = build_command_base(
+            self._speed_subdevice, SUBDEVICE_FAN_SPEED
+        )
 
         self._attr_unique_id = f"{DOMAIN}_{self._root_uuid}_fan"
         self._attr_name = self._nickname
@@ -158,7 +176,7 @@ class CommaxFan(CoordinatorEntity, FanEntity):
     @property
     def available(self) -> bool:
         """디바이스가 사용 가능한지 반환"""
-        return self.coordinator.last_update_success and self._switch_subdevice is not None
+        return self.coordinator.last_update_success and self._has_subdevice
 
     def _get_switch_state(self) -> bool:
         """전원 상태 확인"""
@@ -166,7 +184,7 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         if value is None:
             return False
 
-        return str(value).lower() in {DEVICE_ON, "on", "1", "true"}
+        return str(value).lower() in DEVICE_ON_VALUES
 
     def _get_current_mode(self) -> Optional[str]:
         """현재 모드 반환"""
@@ -189,30 +207,15 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         if not subdevice:
             return None
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        current = self.coordinator.get_subdevice(self._root_uuid, subdevice.get("subUuid"))
+        if current is None:
             return subdevice.get("value")
 
-        target_uuid = subdevice.get("subUuid")
-        for candidate in device_data.get("subDevice", []):
-            if candidate.get("subUuid") == target_uuid:
-                return candidate.get("value")
-
-        return subdevice.get("value")
+        return current.get("value")
 
     def _speed_to_percentage(self, speed: str) -> Optional[int]:
         """환기 속도를 백분율로 변환"""
-        if not self._speed_options:
-            return None
-
-        try:
-            index = self._speed_options.index(speed)
-        except ValueError:
-            return None
-
-        step = 100 / len(self._speed_options)
-        percentage = round((index + 1) * step)
-        return max(1, min(100, percentage))
+        return self._speed_percentages.get(speed)
 
     def _percentage_to_speed(self, percentage: int) -> Optional[str]:
         """백분율을 환기 속도로 변환"""
@@ -314,31 +317,13 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         await self._send_command(payloads)
 
     def _build_switch_payload(self, value: str) -> dict:
-        return {
-            "value": value,
-            "funcCommand": "set",
-            "type": "readWrite",
-            "subUuid": self._switch_subdevice.get("subUuid"),
-            "sort": SUBDEVICE_SWITCH_BINARY,
-        }
+        return {**self._switch_command, "value": value}
 
     def _build_mode_payload(self, value: str) -> dict:
-        return {
-            "value": value,
-            "funcCommand": "set",
-            "type": "readWrite",
-            "subUuid": self._mode_subdevice.get("subUuid"),
-            "sort": SUBDEVICE_FAN_MODE,
-        }
+        return {**self._mode_command, "value": value}
 
     def _build_speed_payload(self, value: str) -> dict:
-        return {
-            "value": value,
-            "funcCommand": "set",
-            "type": "readWrite",
-            "subUuid": self._speed_subdevice.get("subUuid"),
-            "sort": SUBDEVICE_FAN_SPEED,
-        }
+        return {**self._speed_command, "value": value}
 
     async def _send_command(self, subdevice_payloads: list[dict]) -> None:
         """디바이스 제어 명령 전송"""
@@ -346,12 +331,7 @@ class CommaxFan(CoordinatorEntity, FanEntity):
             _LOGGER.error("환기시스템 제어 페이로드가 비어 있습니다: %s", self._nickname)
             return
 
-        device_data = {
-            "subDevice": subdevice_payloads,
-            "rootUuid": self._root_uuid,
-            "nickname": self._nickname,
-            "rootDevice": self._device_data.get("rootDevice"),
-        }
+        device_data = {**self._command_template, "subDevice": subdevice_payloads}
 
         _LOGGER.debug("전송할 환기 명령 데이터: %s", device_data)
         success = await self._auth_manager.send_device_command(device_data)
@@ -363,11 +343,6 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         else:
             _LOGGER.error("환기시스템 제어 실패: %s", self._nickname)
 
-        asyncio.create_task(self._delayed_refresh())
-
-    async def _delayed_refresh(self) -> None:
-        """1초 후 상태 새로고침"""
-        await asyncio.sleep(1)
         await self.coordinator.async_request_refresh()
 
     def _update_local_subdevice_value(self, sub_uuid: Optional[str], value: str) -> None:
@@ -375,14 +350,9 @@ class CommaxFan(CoordinatorEntity, FanEntity):
         if not sub_uuid:
             return
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
-            return
-
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == sub_uuid:
-                subdevice["value"] = value
-                break
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, sub_uuid)
+        if subdevice is not None:
+            subdevice["value"] = value
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -1,22 +1,20 @@
 """Commax IoT 조명 플랫폼"""
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from homeassistant.components.light import LightEntity, ColorMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .auth import build_switch_payloads
 from .const import (
     DEVICE_OFF,
     DEVICE_ON,
-    DEVICE_VALUE_OFF,
-    DEVICE_VALUE_ON,
+    DEVICE_ON_VALUES,
     DEVICE_TYPE_LIGHT,
     DOMAIN,
     SUBDEVICE_SWITCH_BINARY,
@@ -34,48 +32,68 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     auth_manager = hass.data[DOMAIN][entry.entry_id]["auth_manager"]
 
+    # 코디네이터의 첫 갱신은 __init__.py에서 끝나므로 여기서 다시 갱신하지 않음
     entities = []
 
-    await coordinator.async_refresh()
-
-    for device_uuid, device_data in coordinator.data.items():
-        if device_data.get("commaxDevice") == DEVICE_TYPE_LIGHT:
-            has_switch = any(
-                subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY and
-                subdevice.get("type") == "readWrite"
-                for subdevice in device_data.get("subDevice", [])
+    for device_data in coordinator.get_devices_by_type(DEVICE_TYPE_LIGHT):
+        switch_subdevice = _find_switch_subdevice(device_data)
+        if switch_subdevice is None:
+            _LOGGER.debug(
+                "조명 스위치 서브디바이스가 없어 스킵: %s (UUID: %s)",
+                device_data.get("nickname"),
+                device_data.get("rootUuid"),
             )
+            continue
 
-            if has_switch:
-                entities.append(CommaxLight(coordinator, auth_manager, device_data))
-                _LOGGER.debug(
-                    "조명 디바이스 등록: %s (UUID: %s)",
-                    device_data.get("nickname"),
-                    device_data.get("rootUuid"),
-                )
+        _LOGGER.debug(
+            "조명 디바이스 등록: %s (UUID: %s)",
+            device_data.get("nickname"),
+            device_data.get("rootUuid"),
+        )
+        entities.append(CommaxLight(coordinator, auth_manager, device_data, switch_subdevice))
 
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities)
+
+
+def _find_switch_subdevice(device_data: dict) -> Optional[dict]:
+    """제어 가능한 스위치 서브디바이스 조회"""
+    return next(
+        (
+            subdevice
+            for subdevice in device_data.get("subDevice") or ()
+            if subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY
+            and subdevice.get("type") == "readWrite"
+        ),
+        None,
+    )
+
 
-class CommaxLight(CoordinatorEntity, RestoreEntity, LightEntity):
+class CommaxLight(CoordinatorEntity, LightEntity):
     """Commax IoT 조명 엔터티"""
 
-    def __init__(self, coordinator, auth_manager, device_data):
+    def __init__(self, coordinator, auth_manager, device_data, switch_subdevice: dict):
         """조명 엔터티 초기화"""
         super().__init__(coordinator)
         self._auth_manager = auth_manager
-        self._device_data = device_data
         self._root_uuid = device_data.get("rootUuid")
         self._nickname = device_data.get("nickname", "Commax Light")
 
-        self._switch_subdevice = next(
-            (
-                subdevice
-                for subdevice in device_data.get("subDevice", [])
-                if subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY
-                and subdevice.get("type") == "readWrite"
-            ),
-            None,
+        # 플랫폼 설정 단계에서 이미 찾은 스위치 서브디바이스를 그대로 사용
+        self._switch_sub_uuid = switch_subdevice.get("subUuid")
+        self._root_device = device_data.get("rootDevice")
+        # 코디네이터 갱신 때마다 한 번만 조회해 두는 현재 스위치 서브디바이스
+        self._switch_state: Optional[dict] = coordinator.get_subdevice(
+            self._root_uuid, self._switch_sub_uuid
+        )
+        # 명령 전송 중에만 사용하는 낙관적 상태 (None이면 코디네이터 값 사용)
+        self._optimistic: Optional[bool] = None
+        # 아직 전송되지 않은 명령은 최신 값 하나만 유지
+        self._command_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+        self._command_worker: Optional[asyncio.Task] = None
+
+        self._command_payloads = build_switch_payloads(
+            self._root_uuid, self._nickname, self._root_device, switch_subdevice
         )
 
         self._attr_unique_id = f"{DOMAIN}_{self._root_uuid}_light"
@@ -87,93 +105,83 @@ class CommaxLight(CoordinatorEntity, RestoreEntity, LightEntity):
             identifiers={(DOMAIN, self._root_uuid)},
             name=self._nickname,
             manufacturer="Commax",
-            model=device_data.get("rootDevice", "Light"),
+            model=self._root_device or "Light",
         )
 
-    async def async_added_to_hass(self) -> None:
-        """엔터티 추가 시 마지막 상태 복원"""
-        await super().async_added_to_hass()
-
-        last_state = await self.async_get_last_state()
-        if last_state is not None:
-            self._attr_is_on = last_state.state == STATE_ON
-
     @property
     def is_on(self) -> bool:
         """조명이 켜져 있는지 반환"""
-        if not self._switch_subdevice:
-            return False
+        if self._optimistic is not None:
+            return self._optimistic
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        subdevice = self._switch_state
+        if subdevice is None:
             return self._attr_is_on
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == self._switch_subdevice.get("subUuid"):
-                current_value = subdevice.get("value")
-                if current_value is None:
-                    return self._attr_is_on
-
-                normalized = str(current_value).lower()
-                possible_on_values = {
-                    DEVICE_ON,
-                    DEVICE_VALUE_ON,
-                    DEVICE_VALUE_ON.lower(),
-                    "1",
-                    "true",
-                }
-                is_on = normalized in possible_on_values
-                self._attr_is_on = is_on
-                return is_on
-
-        return self._attr_is_on
+        current_value = subdevice.get("value")
+        if current_value is None:
+            return self._attr_is_on
 
-    @property
-    def available(self) -> bool:
-        """디바이스가 사용 가능한지 반환"""
-        return self.coordinator.last_update_success and self._switch_subdevice is not None
+        is_on = str(current_value).lower() in DEVICE_ON_VALUES
+        self._attr_is_on = is_on
+        return is_on
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """조명 켜기"""
-        if self._switch_subdevice:
-            await self._send_command(DEVICE_ON)
+        self._queue_command(DEVICE_ON)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """조명 끄기"""
-        if self._switch_subdevice:
-            await self._send_command(DEVICE_OFF)
+        self._queue_command(DEVICE_OFF)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """엔터티 제거 시 명령 처리 작업 종료"""
+        await super().async_will_remove_from_hass()
+        if self._command_worker is not None:
+            self._command_worker.cancel()
+            self._command_worker = None
+
+    def _queue_command(self, value: str) -> None:
+        """명령을 대기열에 넣고 아직 전송되지 않은 이전 명령은 버림"""
+        while not self._command_queue.empty():
+            self._command_queue.get_nowait()
+        self._command_queue.put_nowait(value)
+
+        # 응답을 기다리기 전에 요청한 상태를 먼저 표시
+        self._optimistic = value == DEVICE_ON
+        self.async_write_ha_state()
+
+        if self._command_worker is None or self._command_worker.done():
+            self._command_worker = self.hass.async_create_background_task(
+                self._async_process_commands(),
+                name=f"commax_light_commands_{self._root_uuid}",
+            )
+
+    async def _async_process_commands(self) -> None:
+        """대기열의 명령을 하나씩 순서대로 전송"""
+        while True:
+            value = await self._command_queue.get()
+            try:
+                await self._send_command(value)
+            except Exception:
+                _LOGGER.exception("조명 명령 처리 중 오류 발생: %s", self._nickname)
+
+            if self._command_queue.empty():
+                self._optimistic = None
+                self.async_write_ha_state()
 
     async def _send_command(self, value: str) -> None:
         """디바이스 제어 명령 전송"""
-        device_data = {
-            "subDevice": [
-                {
-                    "value": value,
-                    "funcCommand": "set",
-                    "type": "readWrite",
-                    "subUuid": self._switch_subdevice.get("subUuid"),
-                    "sort": SUBDEVICE_SWITCH_BINARY,
-                }
-            ],
-            "rootUuid": self._root_uuid,
-            "nickname": self._nickname,
-            "rootDevice": self._device_data.get("rootDevice"),
-        }
+        device_data = self._command_payloads[value]
 
         success = await self._auth_manager.send_device_command(device_data)
 
         if success:
-            self._update_local_subdevice_value(
-                self._switch_subdevice.get("subUuid"), value
-            )
-            self.async_write_ha_state()
-
-        asyncio.create_task(self._delayed_refresh())
+            self._update_local_subdevice_value(self._switch_sub_uuid, value)
+        else:
+            _LOGGER.error("조명 제어 실패: %s", self._nickname)
 
-
-    async def _delayed_refresh(self) -> None:
-        """1초 후 상태 새로고침"""
-        await asyncio.sleep(1)
+        # 디바운서가 예약만 하고 바로 반환하므로 여러 조명 명령이 한 번의 조회로 합쳐짐
         await self.coordinator.async_request_refresh()
 
     def _update_local_subdevice_value(self, sub_uuid: str, value: str) -> None:
@@ -181,24 +189,17 @@ class CommaxLight(CoordinatorEntity, RestoreEntity, LightEntity):
         if not sub_uuid:
             return
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, sub_uuid)
+        if subdevice is None:
             return
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == sub_uuid:
-                subdevice["value"] = value
-                normalized = str(value).lower()
-                self._attr_is_on = normalized in {
-                    DEVICE_ON,
-                    DEVICE_VALUE_ON,
-                    DEVICE_VALUE_ON.lower(),
-                    "1",
-                    "true",
-                }
-                break
+        subdevice["value"] = value
+        self._attr_is_on = str(value).lower() in DEVICE_ON_VALUES
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """코디네이터 업데이트 처리"""
+        self._switch_state = self.coordinator.get_subdevice(
+            self._root_uuid, self._switch_sub_uuid
+        )
         self.async_write_ha_state()
@@ -1,18 +1,19 @@
 """Commax IoT 스위치 플랫폼"""
-import asyncio
 import logging
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .auth import build_switch_payloads
 from .const import (
     DEVICE_OFF,
     DEVICE_ON,
+    DEVICE_ON_VALUES,
     DEVICE_TYPE_SWITCH,
     DOMAIN,
     SUBDEVICE_SWITCH_BINARY,
@@ -32,54 +33,57 @@ async def async_setup_entry(
 
     entities = []
 
-    # 데이터가 준비될 때까지 기다림
-    if not coordinator.data:
-        await coordinator.async_refresh()
-
-    # 데이터가 여전히 없으면 빈 리스트로 초기화
-    if not coordinator.data:
-        coordinator.data = {}
-
-    for device_uuid, device_data in coordinator.data.items():
-        if (
-            device_data.get("commaxDevice") == DEVICE_TYPE_SWITCH
-            and device_data.get("rootDevice") == "switch"
-        ):
-            # 필수 subDevice 확인
-            has_switch = False
-            for subdevice in device_data.get("subDevice", []):
-                if (subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY and
-                    subdevice.get("type") == "readWrite"):
-                    has_switch = True
-                    break
-
-            if has_switch:
-                entities.append(CommaxSwitch(coordinator, auth_manager, device_data))
+    for device_data in coordinator.get_devices_by_type(DEVICE_TYPE_SWITCH):
+        if device_data.get("rootDevice") != "switch":
+            continue
+
+        # 필수 subDevice 확인 후 찾은 서브디바이스를 엔터티에 그대로 전달
+        switch_subdevice = next(
+            (
+                subdevice
+                for subdevice in device_data.get("subDevice") or ()
+                if subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY
+                and subdevice.get("type") == "readWrite"
+            ),
+            None,
+        )
+
+        if switch_subdevice is not None:
+            entities.append(
+                CommaxSwitch(coordinator, auth_manager, device_data, switch_subdevice)
+            )
 
     _LOGGER.info("총 %d개의 스위치 디바이스 등록됨", len(entities))
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities)
 
 
 class CommaxSwitch(CoordinatorEntity, SwitchEntity):
     """Commax IoT 스위치 엔터티"""
 
-    def __init__(self, coordinator, auth_manager, device_data):
+    def __init__(self, coordinator, auth_manager, device_data, switch_subdevice):
         """스위치 엔터티 초기화"""
         super().__init__(coordinator)
         self._auth_manager = auth_manager
-        self._device_data = device_data
         self._root_uuid = device_data.get("rootUuid")
         self._nickname = device_data.get("nickname", "Commax Switch")
 
-        self._switch_subdevice = None
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("sort") == SUBDEVICE_SWITCH_BINARY and subdevice.get("type") == "readWrite":
-                self._switch_subdevice = subdevice
-                break
+        self._switch_subdevice = switch_subdevice
+        self._switch_sub_uuid = (
+            self._switch_subdevice.get("subUuid") if self._switch_subdevice else None
+        )
+
+        self._command_payloads = build_switch_payloads(
+            self._root_uuid, self._nickname, device_data.get("rootDevice"), self._switch_subdevice
+        )
+
+        # 코디네이터 갱신 때 값이 바뀐 경우에만 상태를 기록하기 위해 마지막 값을 보관
+        self._attr_is_on = self._read_is_on()
+        self._last_update_success = coordinator.last_update_success
 
         self._attr_unique_id = f"{DOMAIN}_{self._root_uuid}_switch"
         self._attr_name = self._nickname
+        self._attr_device_class = SwitchDeviceClass.OUTLET
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._root_uuid)},
             name=self._nickname,
@@ -87,33 +91,16 @@ class CommaxSwitch(CoordinatorEntity, SwitchEntity):
             model=device_data.get("rootDevice", "Switch"),
         )
 
-    @property
-    def is_on(self) -> bool:
-        """스위치가 켜져 있는지 반환"""
+    def _read_is_on(self) -> bool:
+        """코디네이터 데이터에서 스위치가 켜져 있는지 확인"""
         if not self._switch_subdevice:
             return False
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, self._switch_sub_uuid)
+        if subdevice is None:
             return False
 
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == self._switch_subdevice.get("subUuid"):
-                current_value = subdevice.get("value")
-                possible_on_values = [DEVICE_ON, "1", "true", "True", "ON", "on"]
-                return current_value in possible_on_values
-
-        return False
-
-    @property
-    def available(self) -> bool:
-        """디바이스가 사용 가능한지 반환"""
-        return self.coordinator.last_update_success and self._switch_subdevice is not None
-
-    @property
-    def device_class(self) -> str:
-        """디바이스 클래스 반환"""
-        return "outlet"
+        return str(subdevice.get("value")).lower() in DEVICE_ON_VALUES
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """스위치 켜기"""
@@ -132,64 +119,37 @@ class CommaxSwitch(CoordinatorEntity, SwitchEntity):
 
     async def _send_command(self, value: str) -> None:
         """디바이스 제어 명령 전송"""
-        alternative_values = []
-        if value == DEVICE_ON:
-            alternative_values = ["on", "true", "True", "1", "ON"]
-        elif value == DEVICE_OFF:
-            alternative_values = ["off", "false", "False", "0", "OFF"]
-
-        device_data = {
-            "subDevice": [
-                {
-                    "value": value,
-                    "funcCommand": "set",
-                    "type": "readWrite",
-                    "subUuid": self._switch_subdevice.get("subUuid"),
-                    "sort": SUBDEVICE_SWITCH_BINARY,
-                }
-            ],
-            "rootUuid": self._root_uuid,
-            "nickname": self._nickname,
-            "rootDevice": self._device_data.get("rootDevice"),
-        }
+        device_data = self._command_payloads[value]
 
         success = await self._auth_manager.send_device_command(device_data)
 
-        if not success and alternative_values:
-            for alt_value in alternative_values:
-                device_data["subDevice"][0]["value"] = alt_value
-                success = await self._auth_manager.send_device_command(device_data)
-                if success:
-                    break
-
         if success:
-            self._update_local_subdevice_value(
-                self._switch_subdevice.get("subUuid"), value
-            )
+            self._update_local_subdevice_value(self._switch_sub_uuid, value)
+            self._attr_is_on = self._read_is_on()
             self.async_write_ha_state()
-
-        asyncio.create_task(self._delayed_refresh())
-
-    async def _delayed_refresh(self) -> None:
-        """1초 후 상태 새로고침"""
-        await asyncio.sleep(1)
-        await self.coordinator.async_request_refresh()
+        else:
+            # 성공 시에는 로컬 값이 이미 맞으므로 주기적 갱신에 맡기고, 실패 시에만 실제 상태를 다시 조회
+            _LOGGER.error("스위치 제어 실패: %s", self._nickname)
+            await self.coordinator.async_request_refresh()
 
     def _update_local_subdevice_value(self, sub_uuid: str, value: str) -> None:
         """로컬 서브디바이스 값을 즉시 업데이트"""
         if not sub_uuid:
             return
 
-        device_data = self.coordinator.get_device_by_uuid(self._root_uuid)
-        if not device_data:
-            return
-
-        for subdevice in device_data.get("subDevice", []):
-            if subdevice.get("subUuid") == sub_uuid:
-                subdevice["value"] = value
-                break
+        subdevice = self.coordinator.get_subdevice(self._root_uuid, sub_uuid)
+        if subdevice is not None:
+            subdevice["value"] = value
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """코디네이터 업데이트 처리"""
+        """코디네이터 업데이트 처리 (상태가 바뀐 경우에만 기록)"""
+        # 가용성은 CoordinatorEntity.available이 last_update_success로 판단하므로 그 값만 비교
+        is_on = self._read_is_on()
+        last_update_success = self.coordinator.last_update_success
+        if is_on == self._attr_is_on and last_update_success == self._last_update_success:
+            return
+
+        self._attr_is_on = is_on
+        self._last_update_success = last_update_success
         self.async_write_ha_state()
\ No newline at end of file